@@ -3,15 +3,157 @@ A robust and easy-to-use library for controlling LCD displays
 with MicroPython on platforms like ESP32 and ESP8266.
 """
 
+from array import array
 from machine import Pin
+import micropython
+from micropython import const
+import os
+import sys
 import time
 
+# (W1TS, W1TC, pin limit) GPIO output registers: writing a mask sets or
+# clears every pin in it with a single store. Only pins below the limit are
+# in the registers (ESP8266's GPIO16 is an RTC pin and is not).
+_GPIO_OUT_REGS = {
+    'esp32': (0x3FF44008, 0x3FF4400C, 32),
+    'esp8266': (0x60000304, 0x60000308, 16),
+    'rp2': (0xD0000014, 0xD0000018, 30),
+}
+
+# HD44780 instructions
+_CMD_CLEAR = const(0x01)         # Clear Display
+_CMD_HOME = const(0x02)          # Return Home
+_CMD_ENTRY_MODE = const(0x06)    # Entry Mode Set: Increment, No Shift
+_CMD_DISPLAY_OFF = const(0x08)   # Display Off
+_CMD_DISPLAY_ON = const(0x0C)    # Display On, Cursor Off, Blink Off
+_CMD_SHIFT_LEFT = const(0x18)    # Cursor/Display Shift: display left
+_CMD_SHIFT_RIGHT = const(0x1C)   # Cursor/Display Shift: display right
+_CMD_FUNCTION_4BIT = const(0x28) # Function Set: 4-bit, 2 lines, 5x8 font
+_CMD_FUNCTION_8BIT = const(0x38) # Function Set: 8-bit, 2 lines, 5x8 font
+_CMD_SET_CGRAM = const(0x40)     # Set CGRAM Address
+_CMD_SET_DDRAM = const(0x80)     # Set DDRAM Address (row 0)
+_ROW1_DDRAM = const(0xC0)        # Set DDRAM Address for the start of row 1
+
+# High nibbles of the 4-bit reset sequence
+_NIBBLE_RESET = const(0x3)
+_NIBBLE_4BIT = const(0x2)
+
+# Busy flag bit of the status read
+_BUSY_FLAG = const(0x80)
+
+# Number of encoded strings write() keeps before starting over
+_ENCODE_CACHE_SIZE = const(8)
+
+# Upper bound on busy-flag reads before giving up on a single instruction
+_BF_MAX_POLLS = const(1000)
+
+
+def _gpio_out_regs():
+    """Returns the (set, clear, pin limit) GPIO registers for this port, or None if unknown."""
+    # ESP32-S2/S3/C3 also report 'esp32' and RP2350 also reports 'rp2', but
+    # they use a different register map
+    if sys.platform == 'esp32' and not os.uname().machine.endswith('ESP32'):
+        return None
+    if sys.platform == 'rp2' and not os.uname().machine.endswith('RP2040'):
+        return None
+    return _GPIO_OUT_REGS.get(sys.platform)
+
+
+def _build_nibble_lut(pin_numbers):
+    """
+    Maps every 4-bit value to the GPIO masks that present it on four pins.
+    Args:
+        pin_numbers (list): GPIO numbers carrying bits 0-3 of the nibble.
+    Returns:
+        array: 32 words, the set masks for nibbles 0-15 followed by their
+            clear masks, laid out for indexing from viper code.
+    """
+    masks = [1 << pin for pin in pin_numbers]
+    all_masks = 0
+    for mask in masks:
+        all_masks |= mask
+
+    lut = array('I', bytes(4 * 32))
+    for nibble in range(16):
+        set_mask = 0
+        for i in range(4):
+            if (nibble >> i) & 0x01:
+                set_mask |= masks[i]
+        lut[nibble] = set_mask
+        lut[nibble + 16] = all_masks ^ set_mask
+    return lut
+
+
+# Byte strobe through the GPIO registers, built with the viper emitter. The
+# decorator is a compile-time error on firmware without a native emitter, so
+# the source is compiled here rather than in the class body; if that fails,
+# _strobe stays None and LCD falls back to Pin.value().
+_STROBE_SRC = """
+@micropython.viper
+def _strobe(self, byte: int):
+    # Presents a byte on the data lines through the GPIO registers and
+    # pulses E, once in 8-bit mode or once per nibble in 4-bit mode.
+    gpio_set = ptr32(uint(self._gpio_set))
+    gpio_clr = ptr32(uint(self._gpio_clr))
+    high = ptr32(self._nibble_lut)
+    e_mask = int(self._e_mask)
+    nibble = (byte >> 4) & 0x0F
+
+    if self.bit8_mode:
+        low = ptr32(self._low_nibble_lut)
+        low_nibble = byte & 0x0F
+        gpio_set[0] = high[nibble] | low[low_nibble]
+        gpio_clr[0] = high[nibble + 16] | low[low_nibble + 16]
+    else:
+        gpio_set[0] = high[nibble]
+        gpio_clr[0] = high[nibble + 16]
+        gpio_set[0] = e_mask
+        time.sleep_us(1)
+        gpio_clr[0] = e_mask
+        time.sleep_us(1)
+        nibble = byte & 0x0F
+        gpio_set[0] = high[nibble]
+        gpio_clr[0] = high[nibble + 16]
+
+    gpio_set[0] = e_mask
+    time.sleep_us(1)
+    gpio_clr[0] = e_mask
+"""
+
+_namespace = {'micropython': micropython, 'time': time}
+try:
+    exec(_STROBE_SRC, _namespace)
+    _strobe = _namespace['_strobe']
+except SyntaxError:
+    _strobe = None
+del _namespace, _STROBE_SRC
+
+
+class _Batch:
+    """Context manager returned by LCD.batch()."""
+
+    def __init__(self, lcd):
+        self._lcd = lcd
+
+    def __enter__(self):
+        self._lcd._batch_depth += 1
+        return self._lcd
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        lcd = self._lcd
+        lcd._batch_depth -= 1
+        if not lcd._batch_depth and not lcd._use_bf:
+            # Leave the LCD ready for callers that write outside a batch
+            lcd._wait_ready()
+        return False
+
+
 class LCD:
     """
     Control an HD44780-compatible LCD display in 4-bit or 8-bit mode.
     """
 
-    def __init__(self, cols, rows, rs, e, d4, d5, d6, d7, bit8=False, d0=None, d1=None, d2=None, d3=None, backlight_pin=None):
+    def __init__(self, cols, rows, rs, e, d4, d5, d6, d7, bit8=False, d0=None, d1=None, d2=None, d3=None, backlight_pin=None, rw=None, row_offsets=None, enable_post_delay_us=37):
         """
         Initializes the LCD object with the given pin configurations.
 
@@ -24,6 +166,15 @@ class LCD:
             bit8 (bool): If True, enables 8-bit mode.
             d0-d3 (int, optional): Additional GPIO pins for 8-bit mode.
             backlight_pin (int, optional): GPIO pin for controlling the backlight.
+            rw (int, optional): GPIO pin connected to the RW pin of the LCD. When
+                given, the busy flag is polled instead of using fixed delays.
+                The LCD drives the data lines while being read, so use a 3.3V
+                display or level shifting on 3.3V boards.
+            row_offsets (tuple, optional): Set DDRAM Address command for the
+                start of each row. Defaults to the usual 16x4/20x4 layout.
+            enable_post_delay_us (int): Wait after each transfer when the busy
+                flag is not polled. 37us is the datasheet execution time;
+                raise it for slow displays.
         """
         # --- 1. Robust Input Validation (Error Handling) ---
         if not isinstance(bit8, bool):
@@ -31,22 +182,25 @@ class LCD:
         if not isinstance(cols, int) or not isinstance(rows, int):
             raise TypeError("The 'cols' and 'rows' parameters must be integers.")
 
+        if row_offsets is None:
+            row_offsets = (_CMD_SET_DDRAM, _ROW1_DDRAM, _CMD_SET_DDRAM + cols, _ROW1_DDRAM + cols)
+        if len(row_offsets) < rows:
+            raise ValueError("The 'row_offsets' parameter must have an entry for every row; pass it for displays with more than 4 rows.")
+
         if bit8 and (d0 is None or d1 is None or d2 is None or d3 is None):
             raise ValueError("In 8-bit mode, pins d0 to d3 must be provided.")
 
-        all_pin_numbers = [rs, e, d4, d5, d6, d7]
+        all_pin_numbers = (rs, e, d4, d5, d6, d7)
         if bit8:
-            all_pin_numbers.extend([d0, d1, d2, d3])
+            all_pin_numbers += (d0, d1, d2, d3)
         if backlight_pin is not None:
-            all_pin_numbers.append(backlight_pin)
+            all_pin_numbers += (backlight_pin,)
+        if rw is not None:
+            all_pin_numbers += (rw,)
 
-        for pin_number in all_pin_numbers:
-            if not isinstance(pin_number, int):
-                raise TypeError(f"Pin number '{pin_number}' must be an integer.")
-
-            # Common valid range for ESP32 and many other boards
-            if not (0 <= pin_number <= 39):
-                raise ValueError(f"Pin number '{pin_number}' is out of the valid range (0-39).")
+        # Common valid range for ESP32 and many other boards
+        if not all(type(p) is int and 0 <= p <= 39 for p in all_pin_numbers):
+            raise ValueError(f"Pin numbers {all_pin_numbers} must all be integers in the valid range (0-39).")
 
         # --- 2. Pin Configuration ---
         self.pin_rs = Pin(rs, Pin.OUT)
@@ -54,9 +208,22 @@ class LCD:
         self.cols = cols
         self.rows = rows
         self.bit8_mode = bit8
+        self._post_delay_us = enable_post_delay_us
+        self._blank_line = b' ' * cols
+        self._encode_cache = {}
+        self._row_offsets = tuple(row_offsets)
         self.backlight_pin = None
         if backlight_pin is not None:
             self.backlight_pin = Pin(backlight_pin, Pin.OUT)
+        self.pin_rw = None
+        if rw is not None:
+            self.pin_rw = Pin(rw, Pin.OUT, value=0)
+        # The busy flag can only be read once init() has set the interface
+        self._use_bf = False
+        # Inside batch(), the post-transfer wait is deferred to the next write
+        self._batch_depth = 0
+        self._ready_at = 0
+        self._pending = False
 
         data_pin_numbers = [d4, d5, d6, d7]
         if bit8:
@@ -64,14 +231,113 @@ class LCD:
 
         self.data_pins = [Pin(pin, Pin.OUT) for pin in data_pin_numbers]
 
-    def _pulse_enable(self):
+        # Bound methods cached once so the hot path skips attribute lookups
+        self._e_value = self.pin_e.value
+        self._rs_value = self.pin_rs.value
+        # _dNv drives bit N of each transfer (d4-d7 in 4-bit mode)
+        self._d0v, self._d1v, self._d2v, self._d3v = [pin.value for pin in self.data_pins[:4]]
+        if bit8:
+            self._d4v, self._d5v, self._d6v, self._d7v = [pin.value for pin in self.data_pins[4:]]
+        self._bf_value = self.data_pins[-1].value
+
+        # --- 3. Masked Port Writes ---
+        # When the port's GPIO registers are known, drive all data lines with
+        # one set-store and one clear-store instead of one call per pin.
+        regs = _gpio_out_regs()
+        self._fast_gpio = _strobe is not None and regs is not None and max(data_pin_numbers + [e]) < regs[2]
+        if self._fast_gpio:
+            self._gpio_set, self._gpio_clr = regs[:2]
+            self._e_mask = 1 << e
+            # High nibble on d4-d7; in 8-bit mode the low nibble is on d0-d3
+            self._nibble_lut = _build_nibble_lut(data_pin_numbers[-4:])
+            if bit8:
+                self._low_nibble_lut = _build_nibble_lut(data_pin_numbers[:4])
+
+    def _pulse_enable(self, _sl=time.sleep_us):
         """Generates a short pulse on the Enable pin to latch the data."""
-        self.pin_e.value(0)
-        time.sleep_us(1)
-        self.pin_e.value(1)
-        time.sleep_us(1)
-        self.pin_e.value(0)
-        time.sleep_us(100)
+        ev = self._e_value
+        ev(0)
+        _sl(1)
+        ev(1)
+        _sl(1)
+        ev(0)
+        if not self._use_bf:
+            if self._batch_depth:
+                self._ready_at = time.ticks_add(time.ticks_us(), self._post_delay_us)
+                self._pending = True
+            else:
+                _sl(self._post_delay_us)
+
+    def _wait_ready(self):
+        """Waits out the remainder of a deferred post-transfer delay, if any."""
+        if not self._pending:
+            return
+        self._pending = False
+        ready_at = self._ready_at
+        # A deadline further away than one delay is stale and has wrapped
+        # around the ticks_us() period (e.g. a batch held open for minutes)
+        limit = self._post_delay_us
+        while 0 < time.ticks_diff(ready_at, time.ticks_us()) <= limit:
+            pass
+
+    def _wait_long(self):
+        """
+        Waits for a Clear Display or Return Home instruction (up to 1.52ms)
+        to finish. When the busy flag is polled, the next transfer already
+        waits on it, so this only sleeps for the worst case without RW.
+        """
+        if not self._use_bf:
+            time.sleep_ms(2)
+
+    def batch(self):
+        """
+        Returns a context manager for a run of consecutive writes. Inside it,
+        the fixed wait after each transfer overlaps with preparing the next
+        one, and only what is left of it is spent before the next transfer.
+        Has no effect when the busy flag is polled.
+
+        Example:
+            with lcd.batch():
+                lcd.write_buffer(b'Hello')
+        """
+        return _Batch(self)
+
+    def _read_bf(self, _sl=time.sleep_us):
+        """
+        Reads the busy flag and address counter. The data pins must already
+        be inputs and RW must be high.
+        Returns:
+            int: Bit 7 is the busy flag.
+        """
+        ev = self._e_value
+        ev(1)
+        _sl(1)
+        value = self._bf_value() << 7
+        ev(0)
+        _sl(1)
+        if not self.bit8_mode:
+            # Clock out the low nibble to keep the LCD in step
+            ev(1)
+            _sl(1)
+            ev(0)
+            _sl(1)
+        return value
+
+    def _wait_not_busy(self):
+        """Polls the busy flag until the LCD is ready for the next instruction."""
+        for pin in self.data_pins:
+            pin.init(Pin.IN)
+        self.pin_rs.value(0)
+        self.pin_rw.value(1)
+
+        # Bounded so a disconnected display cannot hang the caller
+        for _ in range(_BF_MAX_POLLS):
+            if not self._read_bf() & _BUSY_FLAG:
+                break
+
+        self.pin_rw.value(0)
+        for pin in self.data_pins:
+            pin.init(Pin.OUT)
 
     def _send_byte(self, byte, mode):
         """
@@ -80,36 +346,84 @@ class LCD:
             byte (int): The byte to send.
             mode (int): 0 for command, 1 for data.
         """
-        self.pin_rs.value(mode)
+        if self._use_bf:
+            self._wait_not_busy()
+        elif self._batch_depth:
+            self._wait_ready()
+
+        self._rs_value(mode)
+
+        if self._fast_gpio:
+            _strobe(self, byte)
+            if not self._use_bf:
+                if self._batch_depth:
+                    self._ready_at = time.ticks_add(time.ticks_us(), self._post_delay_us)
+                    self._pending = True
+                else:
+                    time.sleep_us(self._post_delay_us)
+            return
 
         if self.bit8_mode:
-            for i in range(8):
-                bit = (byte >> i) & 0x01
-                self.data_pins[i].value(bit)
+            self._d0v(byte & 0x01)
+            self._d1v((byte >> 1) & 0x01)
+            self._d2v((byte >> 2) & 0x01)
+            self._d3v((byte >> 3) & 0x01)
+            self._d4v((byte >> 4) & 0x01)
+            self._d5v((byte >> 5) & 0x01)
+            self._d6v((byte >> 6) & 0x01)
+            self._d7v((byte >> 7) & 0x01)
         else:
             # Send high nibble
-            high_nibble = byte >> 4
-            for i in range(4):
-                bit = (high_nibble >> i) & 0x01
-                self.data_pins[i].value(bit)
+            self._d0v((byte >> 4) & 0x01)
+            self._d1v((byte >> 5) & 0x01)
+            self._d2v((byte >> 6) & 0x01)
+            self._d3v((byte >> 7) & 0x01)
             self._pulse_enable()
 
             # Send low nibble
-            low_nibble = byte & 0x0F
-            for i in range(4):
-                bit = (low_nibble >> i) & 0x01
-                self.data_pins[i].value(bit)
+            self._d0v(byte & 0x01)
+            self._d1v((byte >> 1) & 0x01)
+            self._d2v((byte >> 2) & 0x01)
+            self._d3v((byte >> 3) & 0x01)
 
         self._pulse_enable()
 
+    def _send_nibble(self, nibble, mode):
+        """
+        Sends a single 4-bit transfer on d4-d7, as needed by the 4-bit reset
+        sequence before the LCD has been switched to 4-bit mode.
+        Args:
+            nibble (int): The value to send (low 4 bits are used).
+            mode (int): 0 for command, 1 for data.
+        """
+        self._rs_value(mode)
+        self._d0v(nibble & 0x01)
+        self._d1v((nibble >> 1) & 0x01)
+        self._d2v((nibble >> 2) & 0x01)
+        self._d3v((nibble >> 3) & 0x01)
+        self._pulse_enable()
+
+    def write_buffer(self, buf):
+        """
+        Writes raw character codes at the current cursor position, without
+        per-character validation.
+        Args:
+            buf (bytes): The character codes to write.
+        """
+        sb = self._send_byte
+        with self.batch():
+            for b in buf:
+                sb(b, 1)
+
     def write_char(self, c):
         """
         Writes a single character to the LCD.
         Args:
             c (str): The character to write.
         """
-        if not isinstance(c, str) or len(c) != 1:
-            raise TypeError("The input must be a single character string.")
+        if __debug__:
+            if not isinstance(c, str) or len(c) != 1:
+                raise TypeError("The input must be a single character string.")
 
         self._send_byte(ord(c), 1)
 
@@ -119,56 +433,82 @@ class LCD:
         Args:
             cmd (int): The command to send.
         """
-        if not isinstance(cmd, int):
-            raise TypeError("The command must be an integer.")
+        if __debug__:
+            if not isinstance(cmd, int):
+                raise TypeError("The command must be an integer.")
 
         self._send_byte(cmd, 0)
 
+    def _encode(self, text):
+        """
+        Converts text to character codes, caching recent results so repeated
+        labels are only encoded once.
+        Args:
+            text (str): The string to convert.
+        Returns:
+            bytes: One character code per character.
+        """
+        cache = self._encode_cache
+        buf = cache.get(text)
+        if buf is None:
+            buf = text.encode()
+            if len(buf) != len(text):
+                # Non-ASCII text: send each character's code (e.g. chr(223))
+                buf = bytes([ord(c) & 0xFF for c in text])
+            if len(cache) >= _ENCODE_CACHE_SIZE:
+                cache.clear()
+            cache[text] = buf
+        return buf
+
     def write(self, text, col=0, row=0, clear_line=True):
         """
         Writes a string to the LCD at a specified position.
         Args:
-            text (str): The string to write.
+            text (str or bytes): The string, or raw character codes, to write.
             col (int): Starting column (0-indexed).
             row (int): Starting row (0-indexed).
             clear_line (bool): If True, clears the entire line before writing.
         """
-        if not isinstance(text, str):
-            raise TypeError("The 'text' parameter must be a string.")
-        if not isinstance(col, int) or not isinstance(row, int):
-            raise TypeError("The 'col' and 'row' parameters must be integers.")
-        if not isinstance(clear_line, bool):
-            raise TypeError("The 'clear_line' parameter must be a boolean.")
+        if __debug__:
+            if not isinstance(text, (str, bytes, bytearray)):
+                raise TypeError("The 'text' parameter must be a string or bytes.")
+            if not isinstance(col, int) or not isinstance(row, int):
+                raise TypeError("The 'col' and 'row' parameters must be integers.")
+            if not isinstance(clear_line, bool):
+                raise TypeError("The 'clear_line' parameter must be a boolean.")
 
         if not (0 <= col < self.cols and 0 <= row < self.rows):
             raise ValueError(f"Position ({col}, {row}) is out of bounds for a {self.cols}x{self.rows} display.")
 
-        if clear_line:
-            self.position(0, row)
-            for _ in range(self.cols):
-                self.write_char(' ')
-
-        self.position(col, row)
-
-        current_col = col
-        for char in text:
-            if current_col >= self.cols:
-                current_col = 0
-                if row + 1 < self.rows:
-                    row += 1
-                    self.position(current_col, row)
-                else:
-                    break
+        buf = text if not isinstance(text, str) else self._encode(text)
 
-            self.write_char(char)
-            current_col += 1
+        # Arguments are validated above, so position the cursor directly
+        # rather than through position()/command()
+        if clear_line:
+            self._send_byte(self._row_offsets[row], 0)
+            self.write_buffer(self._blank_line)
+
+        # Split the text at row boundaries up front and send each row's
+        # slice in one call, instead of testing for a wrap on every char
+        chunks = [(col, row, 0, self.cols - col)]
+        start = self.cols - col
+        for next_row in range(row + 1, self.rows):
+            if start >= len(buf):
+                break
+            chunks.append((0, next_row, start, start + self.cols))
+            start += self.cols
+
+        view = memoryview(buf)
+        for chunk_col, chunk_row, start, end in chunks:
+            self._send_byte(self._row_offsets[chunk_row] + chunk_col, 0)
+            self.write_buffer(view[start:end])
 
     def clear(self):
         """
         Clears the entire LCD display and returns the cursor to the home position.
         """
-        self.command(0x01)
-        time.sleep_ms(2)
+        self.command(_CMD_CLEAR)
+        self._wait_long()
 
     def position(self, col, row):
         """
@@ -177,48 +517,47 @@ class LCD:
             col (int): The column number (0-indexed).
             row (int): The row number (0-indexed).
         """
-        if not isinstance(col, int) or not isinstance(row, int):
-            raise TypeError("The 'col' and 'row' parameters must be integers.")
-
         if not (0 <= col < self.cols and 0 <= row < self.rows):
             raise ValueError(f"Position ({col}, {row}) is out of bounds for a {self.cols}x{self.rows} display.")
 
-        if row == 0:
-            address = 0x80 + col
-        elif row == 1:
-            address = 0xC0 + col
-        else:
-            address = 0x80 + (0x40 * row) + col
-
-        self.command(address)
+        self.command(self._row_offsets[row] + col)
 
     def init(self):
         """Initializes the LCD for operation by sending the required command sequence."""
-        # Wait for the LCD to power up
-        time.sleep_ms(15)
+        # The busy flag is not valid until the interface has been set
+        self._use_bf = False
+
+        # Wait for the LCD to power up (40ms at 2.7V, 15ms at 4.5V)
+        time.sleep_ms(50)
 
         if self.bit8_mode:
             # 8-bit mode initialization sequence
-            self.command(0x38) # Function Set: 8-bit, 2 lines, 5x8 font
-            self.command(0x0C) # Display On, Cursor Off, Blink Off
-            self.command(0x06) # Entry Mode Set: Increment, No Shift
-            self.command(0x01) # Clear Display
-            time.sleep_ms(2)
+            self.command(_CMD_FUNCTION_8BIT)
+            self._use_bf = self.pin_rw is not None
+            self.command(_CMD_DISPLAY_ON)
+            self.command(_CMD_ENTRY_MODE)
+            self.command(_CMD_CLEAR)
+            self._wait_long()
         else:
             # 4-bit mode initialization sequence
             # This requires a specific sequence of sending only the high nibble
-            self._send_byte(0x33, 0)
-            self._send_byte(0x32, 0)
-            self.command(0x28) # Function Set: 4-bit, 2 lines, 5x8 font
-            self.command(0x0C) # Display On, Cursor Off, Blink Off
-            self.command(0x06) # Entry Mode Set: Increment, No Shift
-            self.command(0x01) # Clear Display
-            time.sleep_ms(2)
+            self._send_nibble(_NIBBLE_RESET, 0)
+            time.sleep_ms(5)
+            self._send_nibble(_NIBBLE_RESET, 0)
+            time.sleep_us(150)
+            self._send_nibble(_NIBBLE_RESET, 0)
+            self._send_nibble(_NIBBLE_4BIT, 0)
+            self.command(_CMD_FUNCTION_4BIT)
+            self._use_bf = self.pin_rw is not None
+            self.command(_CMD_DISPLAY_ON)
+            self.command(_CMD_ENTRY_MODE)
+            self.command(_CMD_CLEAR)
+            self._wait_long()
 
     def home(self):
         """Returns the cursor to the home position (0, 0) without clearing the display."""
-        self.command(0x02)
-        time.sleep_ms(2)
+        self.command(_CMD_HOME)
+        self._wait_long()
 
     def display_on_off(self, state):
         """Turns the display on or off.
@@ -232,9 +571,9 @@ class LCD:
             raise TypeError("The 'state' parameter must be a boolean.")
 
         if state:
-            self.command(0x0C) # Display ON
+            self.command(_CMD_DISPLAY_ON)
         else:
-            self.command(0x08) # Display OFF
+            self.command(_CMD_DISPLAY_OFF)
 
     def backlight_on_off(self, state):
         """Turns the display backlight on or off, if a backlight pin was specified.
@@ -254,8 +593,8 @@ class LCD:
 
     def write_line(self, text, row=0):
         """Writes a string to a specific line, automatically clearing it first."""
-        if not isinstance(text, str):
-            raise TypeError("The 'text' parameter must be a string.")
+        if not isinstance(text, (str, bytes, bytearray)):
+            raise TypeError("The 'text' parameter must be a string or bytes.")
         if not isinstance(row, int):
             raise TypeError("The 'row' parameter must be an integer.")
         if not (0 <= row < self.rows):
@@ -269,22 +608,37 @@ class LCD:
             location (int): The memory location (0-7) to store the character.
             char_map (list): A list of 8 integers representing the pixel map.
         """
-        if not isinstance(location, int) or not (0 <= location <= 7):
+        self.create_chars(location, [char_map])
+
+    def create_chars(self, start_location, char_maps):
+        """Creates consecutive custom characters in the LCD's CGRAM.
+        The CGRAM address is set once and all patterns are streamed after it.
+        Args:
+            start_location (int): The memory location (0-7) of the first character.
+            char_maps (list): A list of pixel maps, each a list of 8 integers.
+        """
+        if not isinstance(start_location, int) or not (0 <= start_location <= 7):
             raise ValueError("Location must be an integer between 0 and 7.")
-        if not isinstance(char_map, list) or len(char_map) != 8:
-            raise TypeError("Char map must be a list of 8 integers.")
+        if start_location + len(char_maps) > 8:
+            raise ValueError("Only 8 custom characters fit in CGRAM.")
+
+        for char_map in char_maps:
+            if not isinstance(char_map, list) or len(char_map) != 8:
+                raise TypeError("Char map must be a list of 8 integers.")
+
+            # Ensure pattern values are within the valid range (0-31)
+            for byte in char_map:
+                if not isinstance(byte, int) or not (0 <= byte <= 31):
+                    raise ValueError("Char map values must be integers between 0 and 31.")
 
-        # Ensure pattern values are within the valid range (0-31)
-        for byte in char_map:
-            if not isinstance(byte, int) or not (0 <= byte <= 31):
-                raise ValueError("Char map values must be integers between 0 and 31.")
+        # Set the CGRAM address to the first location; it auto-increments
+        self._send_byte(_CMD_SET_CGRAM + (start_location << 3), 0)
 
-        # Set the CGRAM address to the specified location
-        self.command(0x40 + (location << 3))
-        
-        # Send each byte of the pattern as raw data (not a character)
-        for byte in char_map:
-            self._send_byte(byte, 1)
+        # Send the patterns as raw data (not characters) in one stream
+        buf = bytearray()
+        for char_map in char_maps:
+            buf.extend(bytes(char_map))
+        self.write_buffer(buf)
 
     def display_shift(self, direction):
         """Shifts the entire display content without changing the DDRAM address.
@@ -292,9 +646,9 @@ class LCD:
             direction (str): 'left' or 'right'.
         """
         if direction == 'left':
-            self.command(0x18)
+            self.command(_CMD_SHIFT_LEFT)
         elif direction == 'right':
-            self.command(0x1C)
+            self.command(_CMD_SHIFT_RIGHT)
         else:
             raise ValueError("Direction must be 'left' or 'right'.")
 